@@ -6,51 +6,60 @@ Command Line Interface for Employee Digital Footprint Summarizer
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from data_collectors.logins import get_logins
-from data_collectors.file_shares import get_file_shares
-from data_collectors.app_usage import get_app_usage
-from report.pdf_generator import DigitalFootprintReport
 from utils.helpers import (get_system_info, create_output_directory, 
                           get_unique_filename, save_report_metadata,
-                          filter_data_by_date_range)
+                          filter_collected_data)
 
-def collect_data(collect_logins=True, collect_files=True, collect_apps=True):
-    """Collect data based on user preferences."""
+def collect_data(collect_logins=True, collect_files=True, collect_apps=True,
+                 since=None, until=None):
+    """Collect data based on user preferences, optionally limited to a date range."""
+    # Imported here so --help and --system-info don't load psutil and friends
+    from data_collectors.logins import get_logins
+    from data_collectors.file_shares import get_file_shares
+    from data_collectors.app_usage import get_app_usage
+    
     data = {}
     
+    # (key, collector, progress message, result label)
+    collectors = []
     if collect_logins:
-        print("Collecting login data...")
-        data['logins'] = get_logins()
-        print(f"✓ Collected {len(data['logins'])} login events")
-    
+        collectors.append(('logins', get_logins, "Collecting login data...", "login events"))
     if collect_files:
-        print("Collecting file shares data...")
-        data['file_shares'] = get_file_shares()
-        print(f"✓ Collected {len(data['file_shares'])} file shares")
-    
+        collectors.append(('file_shares', get_file_shares, "Collecting file shares data...", "file shares"))
     if collect_apps:
-        print("Collecting application usage data...")
-        data['app_usage'] = get_app_usage()
-        print(f"✓ Collected {len(data['app_usage'])} application events")
+        collectors.append(('app_usage', get_app_usage, "Collecting application usage data...", "application events"))
+    
+    if not collectors:
+        return data
+    
+    # The collectors are I/O bound, so run them concurrently and report
+    # the results in a fixed order
+    with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+        futures = [(key, executor.submit(collector, since=since, until=until), message, label)
+                   for key, collector, message, label in collectors]
+        for key, future, message, label in futures:
+            print(message)
+            data[key] = future.result()
+            print(f"✓ Collected {len(data[key])} {label}")
     
     return data
 
 def generate_report(data, output_path, title, start_date=None, end_date=None):
     """Generate PDF report."""
+    from report.pdf_generator import DigitalFootprintReport
+    
     print(f"Generating report: {title}")
     
     # Filter data by date range if specified
     if start_date and end_date:
         print(f"Filtering data from {start_date} to {end_date}")
-        filtered_data = {}
-        for key, items in data.items():
-            filtered_data[key] = filter_data_by_date_range(items, start_date, end_date)
-        data = filtered_data
+        data = filter_collected_data(data, start_date, end_date)
     
     # Create report
     report_generator = DigitalFootprintReport(output_path)
@@ -84,8 +93,18 @@ def generate_report(data, output_path, title, start_date=None, end_date=None):
     
     return report_path
 
-def main():
-    """Main CLI function."""
+def print_system_info():
+    """Print system information."""
+    system_info = get_system_info()
+    print("System Information:")
+    for key, value in system_info.items():
+        print(f"  {key}: {value}")
+
+# Built on first use and reused when main() is called repeatedly
+_PARSER = None
+
+def _build_parser():
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description="Employee Digital Footprint Summarizer - CLI Version",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -133,14 +152,25 @@ Examples:
     parser.add_argument('--system-info', action='store_true',
                        help='Display system information and exit')
     
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main CLI function."""
+    # Plain --system-info is a common quick query; answer it without
+    # building the argument parser. --help still goes through argparse so
+    # its output stays in sync with _build_parser().
+    if sys.argv[1:] == ['--system-info']:
+        print_system_info()
+        return
+    
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    args = _PARSER.parse_args()
     
     # Display system info if requested
     if args.system_info:
-        system_info = get_system_info()
-        print("System Information:")
-        for key, value in system_info.items():
-            print(f"  {key}: {value}")
+        print_system_info()
         return
     
     # Determine what to collect
@@ -182,19 +212,28 @@ Examples:
         output_path = args.output
     else:
         output_dir = create_output_directory()
-        filename = get_unique_filename("digital_footprint_report")
-        output_path = os.path.join(output_dir, filename)
+        output_path = get_unique_filename(os.path.join(output_dir, "digital_footprint_report"))
     
     print("Employee Digital Footprint Summarizer - CLI")
     print("=" * 50)
     
     # Collect data
     try:
-        data = collect_data(collect_logins, collect_files, collect_apps)
+        # Hand the date range to the collectors so out-of-range entries are
+        # skipped at the source rather than collected and filtered later
+        if start_date and end_date:
+            data = collect_data(collect_logins, collect_files, collect_apps,
+                                since=start_date, until=end_date)
+        else:
+            data = collect_data(collect_logins, collect_files, collect_apps)
         
         if not any(data.values()):
-            print("Warning: No data collected. Check your system permissions.")
-            return 1
+            # With a date range, nothing collected just means no activity in
+            # that range; the report still records that
+            if not (start_date and end_date):
+                print("Warning: No data collected. Check your system permissions.")
+                return 1
+            print(f"Note: No activity found between {start_date} and {end_date}.")
         
         # Generate report
         report_path = generate_report(data, output_path, args.title, start_date, end_date)
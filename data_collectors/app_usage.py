@@ -2,39 +2,50 @@ import platform
 import psutil
 import os
 from datetime import datetime, timedelta
+from operator import attrgetter
 
-def get_app_usage():
-    """Return a list of app usage events for the current user, cross-platform."""
-    system = platform.system()
-    if system == 'Windows':
-        return _get_app_usage_windows()
-    elif system == 'Darwin':
-        return _get_app_usage_macos()
-    elif system == 'Linux':
-        return _get_app_usage_linux()
-    else:
-        raise NotImplementedError(f"Unsupported OS: {system}")
+from data_collectors.records import AppEvent
+from utils.helpers import sort_most_recent, timestamp_bounds
 
-def _get_app_usage_windows():
+_SYSTEM = platform.system()
+
+def get_app_usage(limit=None, since=None, until=None):
+    """Return a list of app usage events for the current user, cross-platform.
+    
+    since/until (dates or datetimes) skip processes started outside that
+    range; installed applications have no usage time and are always kept.
+    """
+    if _IMPL is None:
+        raise NotImplementedError(f"Unsupported OS: {_SYSTEM}")
+    return _IMPL(limit, since, until)
+
+def _get_app_usage_windows(limit=None, since=None, until=None):
     """Collect app usage events on Windows."""
-    app_usage = []
+    running_processes = []
+    installed_apps = []
+    lower, upper = timestamp_bounds(since, until)
     
-    # Get currently running processes
+    # Get currently running processes. cpu_percent is left out: on a first
+    # call it always reports 0.0, so it only costs an extra lookup per process.
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'exe', 'create_time', 'cpu_percent', 'memory_percent']):
+        from_timestamp = datetime.fromtimestamp
+        for proc in psutil.process_iter(['pid', 'name', 'exe', 'create_time', 'memory_percent']):
             try:
                 proc_info = proc.info
-                if proc_info['exe']:  # Only processes with executable path
-                    app_usage.append({
-                        'name': proc_info['name'],
-                        'path': proc_info['exe'],
-                        'pid': proc_info['pid'],
-                        'start_time': datetime.fromtimestamp(proc_info['create_time']),
-                        'cpu_percent': proc_info['cpu_percent'],
-                        'memory_percent': proc_info['memory_percent'],
-                        'type': 'running_process',
-                        'source': 'psutil'
-                    })
+                # Only processes with executable path and a known start time
+                if proc_info['exe'] and proc_info['create_time']:
+                    if not lower <= proc_info['create_time'] <= upper:
+                        continue
+                    running_processes.append(AppEvent(
+                        name=proc_info['name'],
+                        path=proc_info['exe'],
+                        type='running_process',
+                        source='psutil',
+                        pid=proc_info['pid'],
+                        start_time=from_timestamp(proc_info['create_time']),
+                        memory_percent=proc_info['memory_percent'],
+                        install_date=None
+                    ))
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
     except Exception as e:
@@ -59,15 +70,21 @@ def _get_app_usage_windows():
                             with winreg.OpenKey(key, subkey_name) as subkey:
                                 try:
                                     display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                                    install_date = winreg.QueryValueEx(subkey, "InstallDate")[0] if winreg.QueryValueEx(subkey, "InstallDate") else None
-                                    
-                                    app_usage.append({
-                                        'name': display_name,
-                                        'path': subkey_name,
-                                        'install_date': install_date,
-                                        'type': 'installed_app',
-                                        'source': 'registry'
-                                    })
+                                    try:
+                                        install_date = winreg.QueryValueEx(subkey, "InstallDate")[0]
+                                    except OSError:
+                                        install_date = None
+
+                                    installed_apps.append(AppEvent(
+                                        name=display_name,
+                                        path=subkey_name,
+                                        type='installed_app',
+                                        source='registry',
+                                        pid=None,
+                                        start_time=None,
+                                        memory_percent=None,
+                                        install_date=install_date
+                                    ))
                                 except (FileNotFoundError, OSError):
                                     continue
                         except (FileNotFoundError, OSError):
@@ -77,15 +94,26 @@ def _get_app_usage_windows():
     except Exception as e:
         print(f"Error reading installed apps: {e}")
     
-    # Sort by timestamp (most recent first)
-    app_usage.sort(key=lambda x: x.get('start_time', datetime.min), reverse=True)
+    # Sort by timestamp (most recent first). Installed apps have no start
+    # time, so they follow the running processes in registry order.
+    app_usage = sort_most_recent(running_processes, attrgetter('start_time'), limit)
+    if limit is not None:
+        installed_apps = installed_apps[:limit - len(app_usage)]
+    app_usage.extend(installed_apps)
     
     return app_usage
 
-def _get_app_usage_macos():
+def _get_app_usage_macos(limit=None, since=None, until=None):
     """Collect app usage events on macOS (stub)."""
     return []
 
-def _get_app_usage_linux():
+def _get_app_usage_linux(limit=None, since=None, until=None):
     """Collect app usage events on Linux (stub)."""
-    return [] 
\ No newline at end of file
+    return []
+
+# Platform implementation, picked once at import
+_IMPL = {
+    'Windows': _get_app_usage_windows,
+    'Darwin': _get_app_usage_macos,
+    'Linux': _get_app_usage_linux,
+}.get(_SYSTEM)
@@ -3,89 +3,110 @@ import os
 import psutil
 from datetime import datetime, timedelta
 import glob
+from operator import attrgetter
 
-def get_file_shares():
-    """Return a list of file shares accessed by the current user, cross-platform."""
-    system = platform.system()
-    if system == 'Windows':
-        return _get_file_shares_windows()
-    elif system == 'Darwin':
-        return _get_file_shares_macos()
-    elif system == 'Linux':
-        return _get_file_shares_linux()
-    else:
-        raise NotImplementedError(f"Unsupported OS: {system}")
+from data_collectors.records import FileShareEvent
+from utils.helpers import sort_most_recent, timestamp_bounds
 
-def _get_file_shares_windows():
+_SYSTEM = platform.system()
+
+def get_file_shares(limit=None, since=None, until=None):
+    """Return a list of file shares accessed by the current user, cross-platform.
+    
+    since/until (dates or datetimes) skip entries outside that range.
+    """
+    if _IMPL is None:
+        raise NotImplementedError(f"Unsupported OS: {_SYSTEM}")
+    return _IMPL(limit, since, until)
+
+def _get_file_shares_windows(limit=None, since=None, until=None):
     """Collect file shares accessed on Windows."""
     file_shares = []
+    lower, upper = timestamp_bounds(since, until)
     
     # Get recent files from Windows Recent folder
     try:
         recent_path = os.path.expanduser("~\\AppData\\Roaming\\Microsoft\\Windows\\Recent")
         if os.path.exists(recent_path):
-            for file in os.listdir(recent_path):
-                file_path = os.path.join(recent_path, file)
-                if os.path.isfile(file_path):
+            from_timestamp = datetime.fromtimestamp
+            # scandir entries carry the directory listing's stat data, so
+            # is_file()/stat() don't need a syscall per file on Windows
+            with os.scandir(recent_path) as entries:
+                for entry in entries:
                     try:
-                        stat = os.stat(file_path)
-                        file_shares.append({
-                            'path': file,
-                            'timestamp': datetime.fromtimestamp(stat.st_mtime),
-                            'type': 'recent_file',
-                            'source': 'recent_folder'
-                        })
+                        if entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            if not lower <= stat.st_mtime <= upper:
+                                continue
+                            file_shares.append(FileShareEvent(
+                                path=entry.name,
+                                timestamp=from_timestamp(stat.st_mtime),
+                                type='recent_file',
+                                source='recent_folder'
+                            ))
                     except Exception:
                         continue
     except Exception as e:
         print(f"Error reading recent files: {e}")
     
-    # Get network drives (simplified approach)
+    # Get network drives from the mounted partitions; a single enumeration
+    # instead of probing every drive letter, any of which can stall on a
+    # disconnected share
     try:
-        # Check for common network drive letters
-        for drive in ['Z:', 'Y:', 'X:', 'W:', 'V:', 'U:', 'T:', 'S:', 'R:', 'Q:', 'P:', 'O:', 'N:', 'M:', 'L:', 'K:', 'J:', 'I:', 'H:', 'G:', 'F:', 'E:', 'D:']:
-            if os.path.exists(drive):
-                try:
-                    stat = os.stat(drive)
-                    file_shares.append({
-                        'path': drive,
-                        'timestamp': datetime.fromtimestamp(stat.st_mtime),
-                        'type': 'network_drive',
-                        'source': 'drive_check'
-                    })
-                except Exception:
+        for partition in psutil.disk_partitions(all=True):
+            if 'remote' not in partition.opts:
+                continue
+            try:
+                stat = os.stat(partition.mountpoint)
+                if not lower <= stat.st_mtime <= upper:
                     continue
+                file_shares.append(FileShareEvent(
+                    path=partition.mountpoint,
+                    timestamp=datetime.fromtimestamp(stat.st_mtime),
+                    type='network_drive',
+                    source='drive_check'
+                ))
+            except Exception:
+                continue
     except Exception as e:
         print(f"Error getting network drives: {e}")
     
-    # Get shared folders from registry (simplified)
-    try:
-        import winreg
-        key_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\MountPoints2"
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
-            for i in range(winreg.QueryInfoKey(key)[0]):
-                try:
-                    subkey_name = winreg.EnumKey(key, i)
-                    file_shares.append({
-                        'path': subkey_name,
-                        'timestamp': datetime.now(),
-                        'type': 'mounted_share',
-                        'source': 'registry'
-                    })
-                except Exception:
-                    continue
-    except Exception as e:
-        print(f"Error reading registry: {e}")
+    # Get shared folders from registry (simplified). MountPoints2 has no
+    # access times, so its entries are stamped with the collection time.
+    now = datetime.now()
+    if lower <= now.timestamp() <= upper:
+        try:
+            import winreg
+            key_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\MountPoints2"
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+                for i in range(winreg.QueryInfoKey(key)[0]):
+                    try:
+                        subkey_name = winreg.EnumKey(key, i)
+                        file_shares.append(FileShareEvent(
+                            path=subkey_name,
+                            timestamp=now,
+                            type='mounted_share',
+                            source='registry'
+                        ))
+                    except Exception:
+                        continue
+        except Exception as e:
+            print(f"Error reading registry: {e}")
     
     # Sort by timestamp (most recent first)
-    file_shares.sort(key=lambda x: x['timestamp'], reverse=True)
-    
-    return file_shares
+    return sort_most_recent(file_shares, attrgetter('timestamp'), limit)
 
-def _get_file_shares_macos():
+def _get_file_shares_macos(limit=None, since=None, until=None):
     """Collect file shares accessed on macOS (stub)."""
     return []
 
-def _get_file_shares_linux():
+def _get_file_shares_linux(limit=None, since=None, until=None):
     """Collect file shares accessed on Linux (stub)."""
-    return [] 
\ No newline at end of file
+    return []
+
+# Platform implementation, picked once at import
+_IMPL = {
+    'Windows': _get_file_shares_windows,
+    'Darwin': _get_file_shares_macos,
+    'Linux': _get_file_shares_linux,
+}.get(_SYSTEM)
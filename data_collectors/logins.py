@@ -1,63 +1,78 @@
 import platform
 import psutil
 from datetime import datetime, timedelta
-import win32evtlog
-import win32evtlogutil
-import win32con
-import win32security
+from operator import attrgetter
 
-def get_logins():
-    """Return a list of login events for the current user, cross-platform."""
-    system = platform.system()
-    if system == 'Windows':
-        return _get_logins_windows()
-    elif system == 'Darwin':
-        return _get_logins_macos()
-    elif system == 'Linux':
-        return _get_logins_linux()
-    else:
-        raise NotImplementedError(f"Unsupported OS: {system}")
+from data_collectors.records import LoginEvent
+from utils.helpers import sort_most_recent, timestamp_bounds
 
-def _get_logins_windows():
+_SYSTEM = platform.system()
+
+def get_logins(limit=None, since=None, until=None):
+    """Return a list of login events for the current user, cross-platform.
+    
+    since/until (dates or datetimes) skip events outside that range.
+    """
+    if _IMPL is None:
+        raise NotImplementedError(f"Unsupported OS: {_SYSTEM}")
+    return _IMPL(limit, since, until)
+
+def _get_logins_windows(limit=None, since=None, until=None):
     """Collect login events on Windows using psutil."""
     logins = []
+    lower, upper = timestamp_bounds(since, until)
+    
+    # Query the sessions once; every psutil.users() call enumerates them again
+    try:
+        users = psutil.users()
+    except Exception as e:
+        print(f"Error getting sessions: {e}")
+        users = []
     
     # Get current user sessions
     try:
-        for session in psutil.users():
-            logins.append({
-                'timestamp': datetime.fromtimestamp(session.started),
-                'username': session.name,
-                'host': session.host or 'localhost',
-                'type': 'session',
-                'source': 'psutil'
-            })
+        for session in users:
+            if not lower <= session.started <= upper:
+                continue
+            logins.append(LoginEvent(
+                timestamp=datetime.fromtimestamp(session.started),
+                username=session.name,
+                host=session.host or 'localhost',
+                type='session',
+                source='psutil'
+            ))
     except Exception as e:
         print(f"Error getting sessions: {e}")
     
     # Add current user info
     try:
-        current_user = psutil.users()[0] if psutil.users() else None
-        if current_user:
-            logins.append({
-                'timestamp': datetime.now(),
-                'username': current_user.name,
-                'host': current_user.host or 'localhost',
-                'type': 'current',
-                'source': 'psutil'
-            })
+        current_user = users[0] if users else None
+        now = datetime.now()
+        if current_user and lower <= now.timestamp() <= upper:
+            logins.append(LoginEvent(
+                timestamp=now,
+                username=current_user.name,
+                host=current_user.host or 'localhost',
+                type='current',
+                source='psutil'
+            ))
     except Exception as e:
         print(f"Error getting current user: {e}")
     
     # Sort by timestamp (most recent first)
-    logins.sort(key=lambda x: x['timestamp'], reverse=True)
-    
-    return logins
+    return sort_most_recent(logins, attrgetter('timestamp'), limit)
 
-def _get_logins_macos():
+def _get_logins_macos(limit=None, since=None, until=None):
     """Collect login events on macOS (stub)."""
     return []
 
-def _get_logins_linux():
+def _get_logins_linux(limit=None, since=None, until=None):
     """Collect login events on Linux (stub)."""
-    return [] 
\ No newline at end of file
+    return []
+
+# Platform implementation, picked once at import
+_IMPL = {
+    'Windows': _get_logins_windows,
+    'Darwin': _get_logins_macos,
+    'Linux': _get_logins_linux,
+}.get(_SYSTEM)
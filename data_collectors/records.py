@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+class _Record:
+    """Base class for collector records.
+
+    Records use __slots__ instead of a per-instance dict, and provide
+    dict-style get() and [] access so the report, GUI and existing callers
+    can read records and plain dicts the same way.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        """Return a field value; unknown fields raise KeyError like a dict."""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """Return a field value, or default if the field is missing or None."""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+@dataclass
+class LoginEvent(_Record):
+    """A login session seen on the system."""
+    __slots__ = ('timestamp', 'username', 'host', 'type', 'source')
+    timestamp: datetime
+    username: str
+    host: str
+    type: str
+    source: str
+
+@dataclass
+class FileShareEvent(_Record):
+    """A recent file, network drive or mounted share."""
+    __slots__ = ('path', 'timestamp', 'type', 'source')
+    path: str
+    timestamp: datetime
+    type: str
+    source: str
+
+@dataclass
+class AppEvent(_Record):
+    """A running process or installed application."""
+    __slots__ = ('name', 'path', 'type', 'source', 'pid', 'start_time',
+                 'memory_percent', 'install_date')
+    name: str
+    path: str
+    type: str
+    source: str
+    pid: int
+    start_time: datetime
+    memory_percent: float
+    install_date: str
@@ -1,50 +1,93 @@
 from PySide6.QtWidgets import (QApplication, QMainWindow, QLabel, QVBoxLayout, 
                                QHBoxLayout, QWidget, QPushButton, QProgressBar,
-                               QTextEdit, QDateEdit, QComboBox, QGroupBox,
-                               QGridLayout, QMessageBox, QFileDialog, QTabWidget,
-                               QTableWidget, QTableWidgetItem, QHeaderView, QSplitter)
-from PySide6.QtCore import Qt, QThread, Signal, QDate, QTimer
-from PySide6.QtGui import QFont, QIcon
+                               QTextEdit, QPlainTextEdit, QDateEdit, QCheckBox,
+                               QGroupBox, QGridLayout, QMessageBox, QFileDialog,
+                               QTabWidget, QTableView, QHeaderView, QSplitter)
+from PySide6.QtCore import (Qt, QObject, QThread, Signal, Slot, QDate, QTimer,
+                            QAbstractTableModel, QModelIndex, QUrl,
+                            QStandardPaths)
+from PySide6.QtGui import QFont, QIcon, QDesktopServices
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
-# Import our modules
-from data_collectors.logins import get_logins
-from data_collectors.file_shares import get_file_shares
-from data_collectors.app_usage import get_app_usage
-from report.pdf_generator import DigitalFootprintReport
-from utils.helpers import (get_system_info, format_timestamp, truncate_text,
-                          create_output_directory, get_unique_filename,
-                          save_report_metadata, filter_data_by_date_range)
+# Import our modules. The collectors and the PDF generator pull in psutil
+# and reportlab, so they are imported by the threads that use them.
+from utils.helpers import (get_system_info, format_timestamp,
+                          save_report_metadata, filter_collected_data,
+                          get_cache_key, load_cached_data, save_cached_data)
 
-class DataCollectionThread(QThread):
-    """Thread for collecting data to avoid blocking the GUI."""
+# How long a cached scan may be reused, in seconds
+SCAN_CACHE_MAX_AGE = 15 * 60
+
+# Application stylesheet, parsed once; buttons opt in through their objectName
+APP_STYLESHEET = """
+    QPushButton#primaryButton, QPushButton#successButton {
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        font-size: 14px;
+        border-radius: 5px;
+    }
+    QPushButton#primaryButton {
+        background-color: #3498db;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #2980b9;
+    }
+    QPushButton#successButton {
+        background-color: #27ae60;
+    }
+    QPushButton#successButton:hover {
+        background-color: #229954;
+    }
+    QPushButton#primaryButton:disabled, QPushButton#successButton:disabled {
+        background-color: #bdc3c7;
+    }
+"""
+
+class DataCollector(QObject):
+    """Worker that collects data on its own thread to avoid blocking the GUI."""
     progress = Signal(str)
     finished = Signal(dict)
     error = Signal(str)
     
-    def __init__(self, collect_logins=True, collect_files=True, collect_apps=True):
-        super().__init__()
-        self.collect_logins = collect_logins
-        self.collect_files = collect_files
-        self.collect_apps = collect_apps
-        
-    def run(self):
+    @Slot(bool, bool, bool)
+    def collect(self, collect_logins=True, collect_files=True, collect_apps=True):
         try:
-            data = {}
+            from data_collectors.logins import get_logins
+            from data_collectors.file_shares import get_file_shares
+            from data_collectors.app_usage import get_app_usage
             
-            if self.collect_logins:
-                self.progress.emit("Collecting login data...")
-                data['logins'] = get_logins()
-                
-            if self.collect_files:
-                self.progress.emit("Collecting file shares data...")
-                data['file_shares'] = get_file_shares()
+            # Walking every process is usually the slowest collector, so it
+            # is submitted first to take the first worker
+            tasks = []
+            if collect_apps:
+                tasks.append(('app_usage', get_app_usage, "application usage data"))
+            if collect_logins:
+                tasks.append(('logins', get_logins, "login data"))
+            if collect_files:
+                tasks.append(('file_shares', get_file_shares, "file shares data"))
+            
+            # The collectors are I/O bound, so run them side by side and
+            # report each one as it finishes
+            data = {}
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {}
+                for key, collector, description in tasks:
+                    self.progress.emit(f"Collecting {description}...")
+                    futures[executor.submit(collector)] = (key, description)
                 
-            if self.collect_apps:
-                self.progress.emit("Collecting application usage data...")
-                data['app_usage'] = get_app_usage()
+                try:
+                    for future in as_completed(futures):
+                        key, description = futures[future]
+                        data[key] = future.result()
+                        self.progress.emit(f"Collected {description} ({len(data[key])} items)")
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
                 
             self.progress.emit("Data collection completed!")
             self.finished.emit(data)
@@ -52,7 +95,95 @@ class DataCollectionThread(QThread):
         except Exception as e:
             self.error.emit(f"Error during data collection: {str(e)}")
 
+class ReportGenerationThread(QThread):
+    """Thread for building the PDF report to avoid blocking the GUI."""
+    finished = Signal(str)
+    error = Signal(str)
+    
+    def __init__(self, data, output_path, metadata, user_info=None, date_range=None):
+        super().__init__()
+        self.data = data
+        self.output_path = output_path
+        self.metadata = metadata
+        self.user_info = user_info
+        self.date_range = date_range
+        
+    def run(self):
+        try:
+            from report.pdf_generator import DigitalFootprintReport
+            
+            # The save dialog doesn't create folders for a typed-in path
+            output_dir = os.path.dirname(self.output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            
+            report_generator = DigitalFootprintReport(self.output_path)
+            report_path = report_generator.generate_report(
+                self.data.get('logins', []),
+                self.data.get('file_shares', []),
+                self.data.get('app_usage', []),
+                user_info=self.user_info,
+                date_range=self.date_range
+            )
+            save_report_metadata(report_path, self.metadata)
+            self.finished.emit(report_path)
+            
+        except Exception as e:
+            self.error.emit(str(e))
+
+# Display formatters for table columns; other columns are shown with str()
+CELL_FORMATTERS = {
+    'timestamp': format_timestamp,
+    'start_time': format_timestamp,
+    'memory_percent': lambda value: f"{value:.1f}%" if isinstance(value, float) else "N/A",
+}
+
+class FootprintTableModel(QAbstractTableModel):
+    """Read-only table model over a list of collected records.
+    
+    Cells are formatted on demand, so only the rows the view actually
+    paints are ever converted to strings.
+    """
+    
+    def __init__(self, headers, columns, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._columns = columns
+        self._formatters = [CELL_FORMATTERS.get(column, str) for column in columns]
+        self._rows = []
+        
+    def set_rows(self, rows):
+        """Replace the records shown by the model."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        # Row numbers and other roles come from the base model
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole) or not index.isValid():
+            return None
+        
+        column = self._columns[index.column()]
+        value = self._rows[index.row()].get(column, '')
+        if role == Qt.ToolTipRole:
+            # Long paths are elided by the view; show them in full on hover
+            return str(value) if column == 'path' else None
+        return self._formatters[index.column()](value)
+
 class MainWindow(QMainWindow):
+    collect_requested = Signal(bool, bool, bool)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Employee Digital Footprint Summarizer")
@@ -60,7 +191,16 @@ class MainWindow(QMainWindow):
         
         # Data storage
         self.collected_data = {}
-        self.collection_thread = None
+        self.report_thread = None
+        self.system_info = {}
+        self.scan_cache_key = None
+        
+        # Data collection runs on one long-lived worker thread, started once
+        # and reused for every scan
+        self.collection_thread = QThread(self)
+        self.collector = DataCollector()
+        self.collector.moveToThread(self.collection_thread)
+        self.collection_thread.start()
         
         # Setup UI
         self.setup_ui()
@@ -114,20 +254,20 @@ class MainWindow(QMainWindow):
         options_group = QGroupBox("Data Collection Options")
         options_layout = QGridLayout(options_group)
         
-        self.collect_logins_cb = QComboBox()
-        self.collect_logins_cb.addItems(["Yes", "No"])
-        options_layout.addWidget(QLabel("Collect Login Data:"), 0, 0)
-        options_layout.addWidget(self.collect_logins_cb, 0, 1)
+        self.collect_logins_cb = QCheckBox("Collect Login Data")
+        self.collect_logins_cb.setChecked(True)
+        options_layout.addWidget(self.collect_logins_cb, 0, 0)
         
-        self.collect_files_cb = QComboBox()
-        self.collect_files_cb.addItems(["Yes", "No"])
-        options_layout.addWidget(QLabel("Collect File Shares:"), 1, 0)
-        options_layout.addWidget(self.collect_files_cb, 1, 1)
+        self.collect_files_cb = QCheckBox("Collect File Shares")
+        self.collect_files_cb.setChecked(True)
+        options_layout.addWidget(self.collect_files_cb, 1, 0)
         
-        self.collect_apps_cb = QComboBox()
-        self.collect_apps_cb.addItems(["Yes", "No"])
-        options_layout.addWidget(QLabel("Collect App Usage:"), 2, 0)
-        options_layout.addWidget(self.collect_apps_cb, 2, 1)
+        self.collect_apps_cb = QCheckBox("Collect App Usage")
+        self.collect_apps_cb.setChecked(True)
+        options_layout.addWidget(self.collect_apps_cb, 2, 0)
+        
+        self.reuse_scan_cb = QCheckBox(f"Reuse a scan from the last {SCAN_CACHE_MAX_AGE // 60} minutes")
+        options_layout.addWidget(self.reuse_scan_cb, 3, 0)
         
         layout.addWidget(options_group)
         
@@ -135,17 +275,24 @@ class MainWindow(QMainWindow):
         date_group = QGroupBox("Date Range (Optional)")
         date_layout = QGridLayout(date_group)
         
+        self.date_filter_cb = QCheckBox("Filter by date range")
+        self.date_filter_cb.setChecked(True)
+        date_layout.addWidget(self.date_filter_cb, 0, 0, 1, 2)
+        
         self.start_date = QDateEdit()
         self.start_date.setDate(QDate.currentDate().addDays(-7))
         self.start_date.setCalendarPopup(True)
-        date_layout.addWidget(QLabel("Start Date:"), 0, 0)
-        date_layout.addWidget(self.start_date, 0, 1)
+        date_layout.addWidget(QLabel("Start Date:"), 1, 0)
+        date_layout.addWidget(self.start_date, 1, 1)
         
         self.end_date = QDateEdit()
         self.end_date.setDate(QDate.currentDate())
         self.end_date.setCalendarPopup(True)
-        date_layout.addWidget(QLabel("End Date:"), 1, 0)
-        date_layout.addWidget(self.end_date, 1, 1)
+        date_layout.addWidget(QLabel("End Date:"), 2, 0)
+        date_layout.addWidget(self.end_date, 2, 1)
+        
+        # Python dates for the selected range, kept in sync by update_date_range
+        self.update_date_range()
         
         layout.addWidget(date_group)
         
@@ -153,22 +300,7 @@ class MainWindow(QMainWindow):
         controls_layout = QHBoxLayout()
         
         self.collect_button = QPushButton("Collect Data")
-        self.collect_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
+        self.collect_button.setObjectName("primaryButton")
         controls_layout.addWidget(self.collect_button)
         
         self.progress_bar = QProgressBar()
@@ -178,11 +310,20 @@ class MainWindow(QMainWindow):
         layout.addLayout(controls_layout)
         
         # Progress text
-        self.progress_text = QTextEdit()
+        self.progress_text = QPlainTextEdit()
         self.progress_text.setMaximumHeight(100)
         self.progress_text.setPlaceholderText("Collection progress will appear here...")
+        self.progress_text.setMaximumBlockCount(500)
         layout.addWidget(self.progress_text)
         
+        # Progress messages are buffered and appended in one batch so a burst
+        # of messages lays out the log once rather than per line
+        self.log_buffer = []
+        self.log_timer = QTimer(self)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.setInterval(50)
+        self.log_timer.timeout.connect(self.flush_progress)
+        
         self.tab_widget.addTab(collection_widget, "Data Collection")
         
     def setup_data_tab(self):
@@ -206,13 +347,17 @@ class MainWindow(QMainWindow):
         
         # Data tables
         self.data_tables = {}
+        self.table_models = {}
         
         # Logins table
         logins_group = QGroupBox("Login Events")
         logins_layout = QVBoxLayout(logins_group)
-        self.logins_table = QTableWidget()
-        self.logins_table.setColumnCount(5)
-        self.logins_table.setHorizontalHeaderLabels(['Timestamp', 'Username', 'Host', 'Type', 'Source'])
+        self.logins_table = QTableView()
+        self.table_models['logins'] = FootprintTableModel(
+            ['Timestamp', 'Username', 'Host', 'Type', 'Source'],
+            ['timestamp', 'username', 'host', 'type', 'source'], self)
+        self.logins_table.setModel(self.table_models['logins'])
+        self.logins_table.setTextElideMode(Qt.ElideMiddle)
         self.logins_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         logins_layout.addWidget(self.logins_table)
         self.data_tables['logins'] = self.logins_table
@@ -221,9 +366,12 @@ class MainWindow(QMainWindow):
         # File shares table
         files_group = QGroupBox("File Shares")
         files_layout = QVBoxLayout(files_group)
-        self.files_table = QTableWidget()
-        self.files_table.setColumnCount(4)
-        self.files_table.setHorizontalHeaderLabels(['Path', 'Type', 'Source', 'Last Accessed'])
+        self.files_table = QTableView()
+        self.table_models['file_shares'] = FootprintTableModel(
+            ['Path', 'Type', 'Source', 'Last Accessed'],
+            ['path', 'type', 'source', 'timestamp'], self)
+        self.files_table.setModel(self.table_models['file_shares'])
+        self.files_table.setTextElideMode(Qt.ElideMiddle)
         self.files_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         files_layout.addWidget(self.files_table)
         self.data_tables['file_shares'] = self.files_table
@@ -232,9 +380,12 @@ class MainWindow(QMainWindow):
         # App usage table
         apps_group = QGroupBox("Application Usage")
         apps_layout = QVBoxLayout(apps_group)
-        self.apps_table = QTableWidget()
-        self.apps_table.setColumnCount(5)
-        self.apps_table.setHorizontalHeaderLabels(['Name', 'Type', 'Path', 'Start Time', 'Resource Usage'])
+        self.apps_table = QTableView()
+        self.table_models['app_usage'] = FootprintTableModel(
+            ['Name', 'Type', 'Path', 'Start Time', 'Memory %'],
+            ['name', 'type', 'path', 'start_time', 'memory_percent'], self)
+        self.apps_table.setModel(self.table_models['app_usage'])
+        self.apps_table.setTextElideMode(Qt.ElideMiddle)
         self.apps_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         apps_layout.addWidget(self.apps_table)
         self.data_tables['app_usage'] = self.apps_table
@@ -274,30 +425,16 @@ class MainWindow(QMainWindow):
         controls_layout.addWidget(self.browse_button)
         
         self.generate_button = QPushButton("Generate Report")
-        self.generate_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
+        self.generate_button.setObjectName("successButton")
         controls_layout.addWidget(self.generate_button)
         
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
         
         # Report status
-        self.report_status = QTextEdit()
+        self.report_status = QPlainTextEdit()
         self.report_status.setMaximumHeight(100)
+        self.report_status.setMaximumBlockCount(500)
         self.report_status.setPlaceholderText("Report generation status will appear here...")
         layout.addWidget(self.report_status)
         
@@ -307,11 +444,24 @@ class MainWindow(QMainWindow):
         """Setup signal connections."""
         self.collect_button.clicked.connect(self.start_data_collection)
         self.generate_button.clicked.connect(self.generate_report)
+        self.collect_requested.connect(self.collector.collect)
+        self.collector.progress.connect(self.update_progress)
+        self.collector.finished.connect(self.data_collection_finished)
+        self.collector.error.connect(self.data_collection_error)
+        self.start_date.dateChanged.connect(self.update_date_range)
+        self.end_date.dateChanged.connect(self.update_date_range)
+        self.date_filter_cb.toggled.connect(self.start_date.setEnabled)
+        self.date_filter_cb.toggled.connect(self.end_date.setEnabled)
+        
+    def update_date_range(self):
+        """Cache the selected date range as Python dates."""
+        self.filter_start_date = self.start_date.date().toPython()
+        self.filter_end_date = self.end_date.date().toPython()
         
     def load_system_info(self):
         """Load and display system information."""
         try:
-            system_info = get_system_info()
+            system_info = self.system_info = get_system_info()
             info_text = f"""
             <b>Platform:</b> {system_info['platform']} {system_info['platform_version']}<br>
             <b>Machine:</b> {system_info['machine']}<br>
@@ -327,12 +477,13 @@ class MainWindow(QMainWindow):
         """Start the data collection process."""
         self.collect_button.setEnabled(False)
         self.progress_bar.setVisible(True)
+        self.log_buffer.clear()
         self.progress_text.clear()
         
         # Get collection options
-        collect_logins = self.collect_logins_cb.currentText() == "Yes"
-        collect_files = self.collect_files_cb.currentText() == "Yes"
-        collect_apps = self.collect_apps_cb.currentText() == "Yes"
+        collect_logins = self.collect_logins_cb.isChecked()
+        collect_files = self.collect_files_cb.isChecked()
+        collect_apps = self.collect_apps_cb.isChecked()
         
         if not any([collect_logins, collect_files, collect_apps]):
             QMessageBox.warning(self, "Warning", "Please select at least one data type to collect.")
@@ -340,17 +491,32 @@ class MainWindow(QMainWindow):
             self.progress_bar.setVisible(False)
             return
         
-        # Start collection thread
-        self.collection_thread = DataCollectionThread(collect_logins, collect_files, collect_apps)
-        self.collection_thread.progress.connect(self.update_progress)
-        self.collection_thread.finished.connect(self.data_collection_finished)
-        self.collection_thread.error.connect(self.data_collection_error)
-        self.collection_thread.start()
+        # Serve a recent scan with the same options from the cache
+        self.scan_cache_key = None
+        if self.reuse_scan_cb.isChecked():
+            cache_key = get_cache_key(collect_logins, collect_files, collect_apps)
+            cached_data = load_cached_data(cache_key, SCAN_CACHE_MAX_AGE)
+            if cached_data is not None:
+                self.update_progress("Reusing cached scan")
+                self.data_collection_finished(cached_data)
+                return
+            self.scan_cache_key = cache_key
+        
+        # Hand the scan to the collector thread
+        self.collect_requested.emit(collect_logins, collect_files, collect_apps)
         
     def update_progress(self, message):
         """Update progress display."""
-        self.progress_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.progress_text.ensureCursorVisible()
+        self.log_buffer.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        if not self.log_timer.isActive():
+            self.log_timer.start()
+            
+    def flush_progress(self):
+        """Append buffered progress messages to the progress display."""
+        if self.log_buffer:
+            self.progress_text.appendPlainText("\n".join(self.log_buffer))
+            self.log_buffer.clear()
+            self.progress_text.ensureCursorVisible()
         
     def data_collection_finished(self, data):
         """Handle data collection completion."""
@@ -358,6 +524,10 @@ class MainWindow(QMainWindow):
         self.collect_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         
+        if self.scan_cache_key:
+            save_cached_data(self.scan_cache_key, data)
+            self.scan_cache_key = None
+        
         # Update data counts
         self.logins_count_label.setText(f"Logins: {len(data.get('logins', []))}")
         self.files_count_label.setText(f"File Shares: {len(data.get('file_shares', []))}")
@@ -380,46 +550,14 @@ class MainWindow(QMainWindow):
         
     def populate_data_tables(self):
         """Populate the data preview tables."""
-        # Populate logins table
-        if 'logins' in self.collected_data:
-            self.populate_table(self.logins_table, self.collected_data['logins'], [
-                'timestamp', 'username', 'host', 'type', 'source'
-            ])
-            
-        # Populate file shares table
-        if 'file_shares' in self.collected_data:
-            self.populate_table(self.files_table, self.collected_data['file_shares'], [
-                'path', 'type', 'source', 'timestamp'
-            ])
-            
-        # Populate app usage table
-        if 'app_usage' in self.collected_data:
-            self.populate_table(self.apps_table, self.collected_data['app_usage'], [
-                'name', 'type', 'path', 'start_time', 'cpu_percent'
-            ])
-            
-    def populate_table(self, table, data, columns):
-        """Populate a table with data."""
-        table.setRowCount(len(data))
-        
-        for row, item in enumerate(data):
-            for col, column in enumerate(columns):
-                value = item.get(column, '')
-                if column == 'timestamp' or column == 'start_time':
-                    value = format_timestamp(value)
-                elif column == 'path':
-                    value = truncate_text(str(value), 40)
-                elif column == 'cpu_percent':
-                    value = f"{value:.1f}%" if value else "N/A"
-                else:
-                    value = str(value)
-                    
-                table.setItem(row, col, QTableWidgetItem(value))
+        for key, model in self.table_models.items():
+            model.set_rows(self.collected_data.get(key, []))
                 
     def browse_output_path(self):
         """Browse for output file path."""
-        output_dir = create_output_directory()
-        filename = get_unique_filename("digital_footprint_report")
+        output_dir = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
+        # Timestamped, so it won't collide; the dialog confirms overwrites anyway
+        filename = f"digital_footprint_report_{datetime.now():%Y%m%d_%H%M%S}.pdf"
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save Report", 
             os.path.join(output_dir, filename),
@@ -440,75 +578,84 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please specify an output path.")
             return
             
+        self.generate_button.setEnabled(False)
+        self.report_status.clear()
+        self.report_status.appendPlainText("Generating report...")
+        
         try:
-            self.generate_button.setEnabled(False)
-            self.report_status.clear()
-            self.report_status.append("Generating report...")
-            
             # Get report title
             title = self.report_title.toPlainText().strip()
             if not title:
                 title = "Employee Digital Footprint Report"
                 
-            # Create report
-            report_generator = DigitalFootprintReport(output_path)
-            
-            # Get date range
-            start_date = self.start_date.date().toPython()
-            end_date = self.end_date.date().toPython()
-            
             # Filter data by date range if specified
-            filtered_data = {}
-            for key, data in self.collected_data.items():
-                if start_date and end_date:
-                    filtered_data[key] = filter_data_by_date_range(data, start_date, end_date)
-                else:
-                    filtered_data[key] = data
+            if self.date_filter_cb.isChecked():
+                start_date, end_date = self.filter_start_date, self.filter_end_date
+                filtered_data = filter_collected_data(self.collected_data, start_date, end_date)
+            else:
+                start_date = end_date = None
+                filtered_data = self.collected_data
+            counts = {key: len(data) for key, data in filtered_data.items()}
                     
-            # Generate report
-            report_path = report_generator.generate_report(
-                filtered_data.get('logins', []),
-                filtered_data.get('file_shares', []),
-                filtered_data.get('app_usage', []),
-                user_info={'name': get_system_info()['username']},
-                date_range={'start': start_date, 'end': end_date}
-            )
-            
-            # Save metadata
+            # Report metadata
             metadata = {
                 'title': title,
                 'generated_at': datetime.now().isoformat(),
                 'data_counts': {
-                    'logins': len(filtered_data.get('logins', [])),
-                    'file_shares': len(filtered_data.get('file_shares', [])),
-                    'app_usage': len(filtered_data.get('app_usage', []))
+                    'logins': counts.get('logins', 0),
+                    'file_shares': counts.get('file_shares', 0),
+                    'app_usage': counts.get('app_usage', 0)
                 },
                 'date_range': {
                     'start': start_date.isoformat() if start_date else None,
                     'end': end_date.isoformat() if end_date else None
                 }
             }
-            save_report_metadata(report_path, metadata)
-            
-            self.report_status.append(f"Report generated successfully: {report_path}")
-            self.status_bar.showMessage("Report generated successfully")
+        except Exception as e:
+            self.report_generation_error(str(e))
+            return
             
-            # Ask if user wants to open the report
-            reply = QMessageBox.question(
-                self, "Report Generated", 
-                f"Report saved to:\n{report_path}\n\nWould you like to open it?",
-                QMessageBox.Yes | QMessageBox.No
-            )
+        # Build the PDF off the GUI thread
+        self.report_thread = ReportGenerationThread(
+            filtered_data, output_path, metadata,
+            user_info={'name': self.system_info.get('username', 'Unknown')},
+            date_range={'start': start_date, 'end': end_date} if start_date else None
+        )
+        self.report_thread.finished.connect(self.report_generation_finished)
+        self.report_thread.error.connect(self.report_generation_error)
+        self.report_thread.start()
+        
+    def report_generation_finished(self, report_path):
+        """Handle report generation completion."""
+        self.generate_button.setEnabled(True)
+        self.report_status.appendPlainText(f"Report generated successfully: {report_path}")
+        self.status_bar.showMessage("Report generated successfully")
+        
+        # Ask if user wants to open the report
+        reply = QMessageBox.question(
+            self, "Report Generated", 
+            f"Report saved to:\n{report_path}\n\nWould you like to open it?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(report_path))
             
-            if reply == QMessageBox.Yes:
-                os.startfile(report_path)
-                
-        except Exception as e:
-            self.report_status.append(f"Error generating report: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to generate report: {str(e)}")
-            self.status_bar.showMessage("Report generation failed")
-        finally:
-            self.generate_button.setEnabled(True)
+    def report_generation_error(self, error_message):
+        """Handle report generation errors."""
+        self.generate_button.setEnabled(True)
+        self.report_status.appendPlainText(f"Error generating report: {error_message}")
+        QMessageBox.critical(self, "Error", f"Failed to generate report: {error_message}")
+        self.status_bar.showMessage("Report generation failed")
+
+    def closeEvent(self, event):
+        """Stop the worker threads when the window closes."""
+        self.collection_thread.quit()
+        self.collection_thread.wait()
+        # A report being written is finished rather than torn down mid-build
+        if self.report_thread is not None and self.report_thread.isRunning():
+            self.report_thread.wait()
+        super().closeEvent(event)
 
 def run_gui():
     """Run the GUI application."""
@@ -516,6 +663,7 @@ def run_gui():
     
     # Set application style
     app.setStyle('Fusion')
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Create and show main window
     window = MainWindow()
@@ -4,56 +4,110 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from collections import defaultdict
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from io import BytesIO
 import os
 
+from utils.helpers import truncate_text
+
+# Paragraph styles, built once at import and shared by every report
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=colors.darkblue
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=colors.darkblue
+)
+
+_NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    spaceAfter=6
+)
+
+def _table_style(header_font_size, body_font_size=None):
+    """Build the grey-header, beige-body grid style used by the report tables."""
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]
+    if body_font_size:
+        commands.append(('FONTSIZE', (0, 1), (-1, -1), body_font_size))
+    return TableStyle(commands)
+
+# Table styles, shared by every report
+_SUMMARY_TABLE_STYLE = _table_style(12)
+_LIST_TABLE_STYLE = _table_style(10, 8)
+_APP_TABLE_STYLE = _table_style(9, 8)
+
+# Rows per Table flowable; ReportLab's table layout slows down sharply on
+# very long tables, so long lists are split into several shorter ones
+TABLE_CHUNK_ROWS = 100
+
+def _chunked_tables(rows, header, col_widths, style, chunk=TABLE_CHUNK_ROWS):
+    """Yield styled tables of at most chunk rows, each with the header row."""
+    for start in range(0, len(rows), chunk):
+        table = Table([header] + rows[start:start + chunk], colWidths=col_widths, repeatRows=1)
+        table.setStyle(style)
+        yield table
+
+def _format_time(value, fmt='%Y-%m-%d %H:%M'):
+    """Format an optional datetime for a table cell."""
+    return value.strftime(fmt) if value else 'N/A'
+
 class DigitalFootprintReport:
-    def __init__(self, output_path="digital_footprint_report.pdf"):
+    def __init__(self, output_path="digital_footprint_report.pdf", page_compression=True,
+                 invariant=False):
         self.output_path = output_path
-        self.styles = getSampleStyleSheet()
+        # Compressed page streams make the PDF about three times smaller.
+        # Invariant output pins the PDF's creation date and document ID, which
+        # helps when comparing builds; it is off by default so the file keeps
+        # its real creation date.
+        self.page_compression = page_compression
+        self.invariant = invariant
+        self.styles = _STYLES
         self.setup_custom_styles()
         
     def setup_custom_styles(self):
         """Setup custom paragraph styles for the report."""
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        )
-        
-        self.heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            spaceBefore=20,
-            textColor=colors.darkblue
-        )
-        
-        self.normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=6
-        )
+        self.title_style = _TITLE_STYLE
+        self.heading_style = _HEADING_STYLE
+        self.normal_style = _NORMAL_STYLE
         
     def generate_report(self, logins, file_shares, app_usage, user_info=None, date_range=None):
         """Generate the complete PDF report."""
-        doc = SimpleDocTemplate(self.output_path, pagesize=A4)
+        doc = SimpleDocTemplate(self.output_path, pagesize=A4,
+                                pageCompression=int(self.page_compression),
+                                invariant=int(self.invariant))
         story = []
+        # One timestamp for the whole report, so the pages agree
+        now = datetime.now()
         
         # Title page
-        story.extend(self.create_title_page(user_info))
+        story.extend(self.create_title_page(user_info, now))
         story.append(PageBreak())
         
         # Executive Summary
-        story.extend(self.create_executive_summary(logins, file_shares, app_usage))
+        story.extend(self.create_executive_summary(logins, file_shares, app_usage, now))
         story.append(PageBreak())
         
         # Detailed sections
@@ -69,9 +123,10 @@ class DigitalFootprintReport:
         doc.build(story)
         return self.output_path
         
-    def create_title_page(self, user_info):
+    def create_title_page(self, user_info, now=None):
         """Create the title page."""
         elements = []
+        now = now or datetime.now()
         
         # Title
         title = Paragraph("Employee Digital Footprint Report", self.title_style)
@@ -83,7 +138,7 @@ class DigitalFootprintReport:
             user_text = f"<b>Employee:</b> {user_info.get('name', 'Unknown')}"
             elements.append(Paragraph(user_text, self.normal_style))
         
-        date_text = f"<b>Report Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        date_text = f"<b>Report Generated:</b> {now:%Y-%m-%d %H:%M:%S}"
         elements.append(Paragraph(date_text, self.normal_style))
         
         elements.append(Spacer(1, 3*inch))
@@ -98,9 +153,10 @@ class DigitalFootprintReport:
         
         return elements
         
-    def create_executive_summary(self, logins, file_shares, app_usage):
+    def create_executive_summary(self, logins, file_shares, app_usage, now=None):
         """Create the executive summary section."""
         elements = []
+        now = now or datetime.now()
         
         # Section title
         title = Paragraph("Executive Summary", self.heading_style)
@@ -109,23 +165,14 @@ class DigitalFootprintReport:
         # Summary statistics
         summary_data = [
             ['Metric', 'Count', 'Details'],
-            ['Login Events', str(len(logins)), f"From {len(set(l.get('source', '') for l in logins))} sources"],
+            ['Login Events', str(len(logins)), f"From {len({login.get('source', '') for login in logins})} sources"],
             ['File Shares', str(len(file_shares)), f"Recent files and network drives"],
             ['Applications', str(len(app_usage)), f"Running processes and installed apps"],
-            ['Report Period', 'N/A', f"Generated on {datetime.now().strftime('%Y-%m-%d')}"]
+            ['Report Period', 'N/A', f"Generated on {now:%Y-%m-%d}"]
         ]
         
         summary_table = Table(summary_data, colWidths=[2*inch, 1*inch, 3*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         
         elements.append(summary_table)
         elements.append(Spacer(1, 0.5*inch))
@@ -145,31 +192,19 @@ class DigitalFootprintReport:
             return elements
         
         # Login events table
-        login_data = [['Timestamp', 'Username', 'Host', 'Type', 'Source']]
-        
-        for login in logins[:20]:  # Limit to 20 most recent
-            login_data.append([
-                login.get('timestamp', '').strftime('%Y-%m-%d %H:%M') if login.get('timestamp') else 'N/A',
-                login.get('username', 'Unknown'),
-                login.get('host', 'Unknown'),
-                login.get('type', 'Unknown'),
-                login.get('source', 'Unknown')
-            ])
-        
-        login_table = Table(login_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1*inch, 1*inch])
-        login_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 8)
-        ]))
-        
-        elements.append(login_table)
+        login_data = [
+            [_format_time(login.get('timestamp')),
+             login.get('username', 'Unknown'),
+             login.get('host', 'Unknown'),
+             login.get('type', 'Unknown'),
+             login.get('source', 'Unknown')]
+            for login in logins[:20]  # Limit to 20 most recent
+        ]
+        
+        elements.extend(_chunked_tables(
+            login_data, ['Timestamp', 'Username', 'Host', 'Type', 'Source'],
+            [1.5*inch, 1.5*inch, 1.5*inch, 1*inch, 1*inch], _LIST_TABLE_STYLE
+        ))
         
         if len(logins) > 20:
             elements.append(Spacer(1, 0.2*inch))
@@ -190,30 +225,18 @@ class DigitalFootprintReport:
             return elements
         
         # File shares table
-        file_data = [['Path', 'Type', 'Source', 'Last Accessed']]
-        
-        for file_share in file_shares[:20]:  # Limit to 20 most recent
-            file_data.append([
-                file_share.get('path', 'Unknown')[:50] + '...' if len(file_share.get('path', '')) > 50 else file_share.get('path', 'Unknown'),
-                file_share.get('type', 'Unknown'),
-                file_share.get('source', 'Unknown'),
-                file_share.get('timestamp', '').strftime('%Y-%m-%d %H:%M') if file_share.get('timestamp') else 'N/A'
-            ])
-        
-        file_table = Table(file_data, colWidths=[3*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        file_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 8)
-        ]))
-        
-        elements.append(file_table)
+        file_data = [
+            [truncate_text(file_share.get('path', 'Unknown'), 50),
+             file_share.get('type', 'Unknown'),
+             file_share.get('source', 'Unknown'),
+             _format_time(file_share.get('timestamp'))]
+            for file_share in file_shares[:20]  # Limit to 20 most recent
+        ]
+        
+        elements.extend(_chunked_tables(
+            file_data, ['Path', 'Type', 'Source', 'Last Accessed'],
+            [3*inch, 1.5*inch, 1.5*inch, 1.5*inch], _LIST_TABLE_STYLE
+        ))
         
         if len(file_shares) > 20:
             elements.append(Spacer(1, 0.2*inch))
@@ -233,64 +256,41 @@ class DigitalFootprintReport:
             elements.append(Paragraph("No application usage data found.", self.normal_style))
             return elements
         
-        # Separate running processes and installed apps
-        running_processes = [app for app in app_usage if app.get('type') == 'running_process']
-        installed_apps = [app for app in app_usage if app.get('type') == 'installed_app']
+        # Separate running processes and installed apps in one pass
+        apps_by_type = defaultdict(list)
+        for app in app_usage:
+            apps_by_type[app.get('type')].append(app)
+        running_processes = apps_by_type['running_process']
+        installed_apps = apps_by_type['installed_app']
         
         # Running processes table
         if running_processes:
             elements.append(Paragraph("Currently Running Processes", self.normal_style))
-            process_data = [['Name', 'PID', 'CPU %', 'Memory %', 'Start Time']]
-            
-            for process in running_processes[:15]:  # Limit to 15
-                process_data.append([
-                    process.get('name', 'Unknown')[:30] + '...' if len(process.get('name', '')) > 30 else process.get('name', 'Unknown'),
-                    str(process.get('pid', 'N/A')),
-                    f"{process.get('cpu_percent', 0):.1f}",
-                    f"{process.get('memory_percent', 0):.1f}",
-                    process.get('start_time', '').strftime('%H:%M') if process.get('start_time') else 'N/A'
-                ])
-            
-            process_table = Table(process_data, colWidths=[2*inch, 0.8*inch, 0.8*inch, 0.8*inch, 1.2*inch])
-            process_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTSIZE', (0, 1), (-1, -1), 8)
-            ]))
+            process_data = [
+                [truncate_text(process.get('name', 'Unknown'), 30),
+                 str(process.get('pid', 'N/A')),
+                 f"{process.get('memory_percent') or 0:.1f}",
+                 _format_time(process.get('start_time'), '%H:%M')]
+                for process in running_processes[:15]  # Limit to 15
+            ]
             
-            elements.append(process_table)
+            elements.extend(_chunked_tables(
+                process_data, ['Name', 'PID', 'Memory %', 'Start Time'],
+                [2*inch, 0.8*inch, 0.8*inch, 1.2*inch], _APP_TABLE_STYLE
+            ))
             elements.append(Spacer(1, 0.3*inch))
         
         # Installed applications table
         if installed_apps:
             elements.append(Paragraph("Installed Applications", self.normal_style))
-            app_data = [['Name', 'Install Date']]
-            
-            for app in installed_apps[:20]:  # Limit to 20
-                app_data.append([
-                    app.get('name', 'Unknown')[:50] + '...' if len(app.get('name', '')) > 50 else app.get('name', 'Unknown'),
-                    app.get('install_date', 'N/A')
-                ])
-            
-            app_table = Table(app_data, colWidths=[4*inch, 2*inch])
-            app_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTSIZE', (0, 1), (-1, -1), 8)
-            ]))
+            app_data = [
+                [truncate_text(app.get('name', 'Unknown'), 50),
+                 app.get('install_date', 'N/A')]
+                for app in installed_apps[:20]  # Limit to 20
+            ]
             
-            elements.append(app_table)
+            elements.extend(_chunked_tables(
+                app_data, ['Name', 'Install Date'], [4*inch, 2*inch], _APP_TABLE_STYLE
+            ))
         
         return elements 
\ No newline at end of file
@@ -2,148 +2,241 @@
 """
 Test script for Employee Digital Footprint Summarizer
 This script tests the core functionality without requiring the GUI.
+Run it with pytest, or directly with python for a printed summary.
 """
 
-import sys
 import os
-from datetime import datetime
+import tempfile
+from datetime import date, datetime, timedelta
 
-# Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    import pytest
+except ImportError:  # Only needed when the tests run under pytest
+    pytest = None
 
+from data_collectors.records import LoginEvent, FileShareEvent, AppEvent
+from utils.helpers import (get_system_info, format_timestamp, truncate_text,
+                           filter_data_by_date_range, filter_collected_data,
+                           timestamp_bounds, get_unique_filename, _metadata_path)
+
+# The collectors need psutil and the report needs reportlab; tests for a
+# part whose dependencies are missing are skipped rather than failed
+try:
+    from data_collectors.logins import get_logins
+    from data_collectors.file_shares import get_file_shares
+    from data_collectors.app_usage import get_app_usage
+    HAS_COLLECTORS = True
+except ImportError:
+    HAS_COLLECTORS = False
+
+try:
+    from report.pdf_generator import DigitalFootprintReport
+    HAS_PDF_GENERATOR = True
+except ImportError:
+    HAS_PDF_GENERATOR = False
+
+def skip_unless(available, reason):
+    """Skip a test under pytest when its dependencies are not installed."""
+    if pytest is None:
+        return lambda test: test
+    return pytest.mark.skipif(not available, reason=reason)
+
+@skip_unless(HAS_COLLECTORS, "data collector dependencies not installed")
 def test_data_collectors():
     """Test the data collectors."""
     print("=== Testing Data Collectors ===")
     
-    try:
-        from data_collectors.logins import get_logins
-        print("✓ Login collector imported successfully")
-        
-        logins = get_logins()
-        print(f"✓ Collected {len(logins)} login events")
-        
-        if logins:
-            print(f"  Sample login: {logins[0]}")
-            
-    except Exception as e:
-        print(f"✗ Login collector failed: {e}")
-    
-    try:
-        from data_collectors.file_shares import get_file_shares
-        print("✓ File shares collector imported successfully")
-        
-        file_shares = get_file_shares()
-        print(f"✓ Collected {len(file_shares)} file shares")
-        
-        if file_shares:
-            print(f"  Sample file share: {file_shares[0]}")
-            
-    except Exception as e:
-        print(f"✗ File shares collector failed: {e}")
-    
-    try:
-        from data_collectors.app_usage import get_app_usage
-        print("✓ App usage collector imported successfully")
-        
-        app_usage = get_app_usage()
-        print(f"✓ Collected {len(app_usage)} app usage events")
-        
-        if app_usage:
-            print(f"  Sample app: {app_usage[0]}")
-            
-    except Exception as e:
-        print(f"✗ App usage collector failed: {e}")
+    logins = get_logins()
+    assert isinstance(logins, list)
+    for login in logins:
+        assert isinstance(login, LoginEvent)
+        assert isinstance(login.timestamp, datetime)
+        assert login.type and login.source
+    print(f"✓ Collected {len(logins)} login events")
+    if logins:
+        print(f"  Sample login: {logins[0]}")
+    
+    file_shares = get_file_shares()
+    assert isinstance(file_shares, list)
+    for file_share in file_shares:
+        assert isinstance(file_share, FileShareEvent)
+        assert isinstance(file_share.timestamp, datetime)
+        assert file_share.path and file_share.type and file_share.source
+    print(f"✓ Collected {len(file_shares)} file shares")
+    if file_shares:
+        print(f"  Sample file share: {file_shares[0]}")
+    
+    app_usage = get_app_usage()
+    assert isinstance(app_usage, list)
+    for app in app_usage:
+        assert isinstance(app, AppEvent)
+        # Some Uninstall keys carry an empty DisplayName, so only the type is checked
+        assert isinstance(app.name, str) and app.source
+        assert app.type in ('running_process', 'installed_app')
+        if app.type == 'running_process':
+            assert isinstance(app.start_time, datetime)
+    print(f"✓ Collected {len(app_usage)} app usage events")
+    if app_usage:
+        print(f"  Sample app: {app_usage[0]}")
 
-def test_pdf_generator():
+@skip_unless(HAS_PDF_GENERATOR, "reportlab not installed")
+def test_pdf_generator(tmp_path):
     """Test the PDF generator."""
     print("\n=== Testing PDF Generator ===")
     
-    try:
-        from report.pdf_generator import DigitalFootprintReport
-        print("✓ PDF generator imported successfully")
-        
-        # Create sample data
-        sample_logins = [
-            {
-                'timestamp': datetime.now(),
-                'username': 'testuser',
-                'host': 'localhost',
-                'type': 'session',
-                'source': 'test'
-            }
-        ]
-        
-        sample_files = [
-            {
-                'path': 'C:\\test\\file.txt',
-                'timestamp': datetime.now(),
-                'type': 'recent_file',
-                'source': 'test'
-            }
-        ]
-        
-        sample_apps = [
-            {
-                'name': 'TestApp',
-                'path': 'C:\\test\\app.exe',
-                'start_time': datetime.now(),
-                'type': 'running_process',
-                'source': 'test'
-            }
-        ]
-        
-        # Generate test report
-        output_path = "test_report.pdf"
-        report_generator = DigitalFootprintReport(output_path)
-        
-        report_path = report_generator.generate_report(
-            sample_logins, sample_files, sample_apps,
-            user_info={'name': 'Test User'}
-        )
-        
-        print(f"✓ Test report generated: {report_path}")
-        
-        # Check if file exists
-        if os.path.exists(report_path):
-            print(f"✓ Report file exists ({os.path.getsize(report_path)} bytes)")
-        else:
-            print("✗ Report file not found")
-            
-    except Exception as e:
-        print(f"✗ PDF generator failed: {e}")
+    # Create sample data
+    sample_logins = [
+        {
+            'timestamp': datetime.now(),
+            'username': 'testuser',
+            'host': 'localhost',
+            'type': 'session',
+            'source': 'test'
+        }
+    ]
+    
+    sample_files = [
+        {
+            'path': 'C:\\test\\file.txt',
+            'timestamp': datetime.now(),
+            'type': 'recent_file',
+            'source': 'test'
+        }
+    ]
+    
+    sample_apps = [
+        {
+            'name': 'TestApp',
+            'path': 'C:\\test\\app.exe',
+            'start_time': datetime.now(),
+            'type': 'running_process',
+            'source': 'test'
+        }
+    ]
+    
+    # Generate test report
+    output_path = os.path.join(tmp_path, "test_report.pdf")
+    report_generator = DigitalFootprintReport(output_path)
+    
+    report_path = report_generator.generate_report(
+        sample_logins, sample_files, sample_apps,
+        user_info={'name': 'Test User'}
+    )
+    print(f"✓ Test report generated: {report_path}")
+    
+    assert report_path == output_path
+    assert os.path.exists(report_path), "Report file not found"
+    print(f"✓ Report file exists ({os.path.getsize(report_path)} bytes)")
 
 def test_utils():
     """Test utility functions."""
     print("\n=== Testing Utilities ===")
     
-    try:
-        from utils.helpers import get_system_info, format_timestamp, truncate_text
-        print("✓ Utilities imported successfully")
-        
-        system_info = get_system_info()
-        print(f"✓ System info collected: {system_info['platform']}")
-        
-        timestamp = format_timestamp(datetime.now())
-        print(f"✓ Timestamp formatted: {timestamp}")
-        
-        truncated = truncate_text("This is a very long text that should be truncated", 20)
-        print(f"✓ Text truncated: {truncated}")
-        
-    except Exception as e:
-        print(f"✗ Utilities failed: {e}")
+    system_info = get_system_info()
+    assert system_info['platform']
+    print(f"✓ System info collected: {system_info['platform']}")
+    
+    timestamp = format_timestamp(datetime.now())
+    print(f"✓ Timestamp formatted: {timestamp}")
+    
+    truncated = truncate_text("This is a very long text that should be truncated", 20)
+    assert len(truncated) == 20 and truncated.endswith("...")
+    print(f"✓ Text truncated: {truncated}")
+
+def test_date_range_filter():
+    """Test the date range filter on presorted and unsorted data."""
+    print("\n=== Testing Date Range Filter ===")
+    
+    # Most recent first, with two logins sharing each timestamp
+    base = datetime(2024, 3, 10, 12, 0)
+    logins = [LoginEvent(base - timedelta(days=day), 'testuser', 'localhost', 'session', 'test')
+              for day in range(10) for _ in range(2)]
+    
+    cases = [
+        (date(2024, 3, 5), date(2024, 3, 7), 6),
+        (datetime(2024, 3, 5, 12, 0), datetime(2024, 3, 7, 12, 0), 6),
+        (datetime(2024, 3, 5, 12, 1), datetime(2024, 3, 7, 11, 59), 2),
+        (date(2024, 3, 20), date(2024, 3, 25), 0),
+        (date(2024, 1, 1), date(2024, 12, 31), 20),
+    ]
+    for start, end, expected in cases:
+        linear = filter_data_by_date_range(logins, start, end)
+        bisected = filter_data_by_date_range(logins, start, end, presorted=True)
+        assert bisected == linear, f"presorted result differs for {start} - {end}"
+        assert len(bisected) == expected, f"expected {expected} logins for {start} - {end}"
+    print(f"✓ Presorted and linear filters agree on {len(cases)} ranges")
+    
+    # Processes are dated by start time; installed apps have no date and stay
+    apps = [
+        AppEvent('recent', 'C:\\test\\recent.exe', 'running_process', 'test', 1, base, 1.0, None),
+        AppEvent('old', 'C:\\test\\old.exe', 'running_process', 'test', 2,
+                 base - timedelta(days=30), 1.0, None),
+        AppEvent('installed', 'TestApp', 'installed_app', 'registry', None, None, None, '20240101'),
+    ]
+    filtered = filter_collected_data({'logins': logins, 'app_usage': apps},
+                                     date(2024, 3, 9), date(2024, 3, 10))
+    assert len(filtered['logins']) == 4
+    assert [app.name for app in filtered['app_usage']] == ['recent', 'installed']
+    print("✓ Collected data filtered by date range")
+    
+    # Collector bounds: open ends are unbounded, dates cover whole days and
+    # datetimes are used as given
+    assert timestamp_bounds() == (float('-inf'), float('inf'))
+    lower, upper = timestamp_bounds(date(2024, 3, 5), date(2024, 3, 7))
+    assert lower == datetime(2024, 3, 5).timestamp()
+    assert upper == datetime(2024, 3, 7, 23, 59, 59, 999999).timestamp()
+    lower, upper = timestamp_bounds(base, None)
+    assert lower == base.timestamp() and upper == float('inf')
+    lower, upper = timestamp_bounds(None, base)
+    assert lower == float('-inf') and upper == base.timestamp()
+    print("✓ Collector timestamp bounds")
+
+def test_output_paths(tmp_path):
+    """Test report and metadata file naming."""
+    print("\n=== Testing Output Paths ===")
+    
+    # Existing reports in the target folder are skipped over
+    for name in ("r.pdf", "r_1.pdf"):
+        open(os.path.join(tmp_path, name), 'w').close()
+    unique = get_unique_filename(os.path.join(tmp_path, "r"))
+    assert unique == os.path.join(tmp_path, "r_2.pdf")
+    print(f"✓ Unique filename: {os.path.basename(unique)}")
+    
+    # Only the final extension is replaced, and a path without one never
+    # maps onto the report itself
+    assert _metadata_path(os.path.join("x.pdf.d", "r.pdf")) == os.path.join("x.pdf.d", "r_metadata.json")
+    assert _metadata_path("report") == "report_metadata.json"
+    print("✓ Metadata paths derived from report paths")
 
 def main():
     """Run all tests."""
     print("Employee Digital Footprint Summarizer - Test Suite")
     print("=" * 50)
     
-    test_data_collectors()
-    test_pdf_generator()
-    test_utils()
+    # (test, dependencies available, needs a scratch directory)
+    tests = [
+        (test_data_collectors, HAS_COLLECTORS, False),
+        (test_pdf_generator, HAS_PDF_GENERATOR, True),
+        (test_utils, True, False),
+        (test_date_range_filter, True, False),
+        (test_output_paths, True, True),
+    ]
+    for test, available, needs_tmp_path in tests:
+        if not available:
+            print(f"\n- {test.__name__} skipped: dependencies not installed")
+            continue
+        try:
+            if needs_tmp_path:
+                with tempfile.TemporaryDirectory() as tmp_path:
+                    test(tmp_path)
+            else:
+                test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
     
     print("\n=== Test Summary ===")
     print("If you see mostly ✓ marks above, the core functionality is working!")
     print("To run the full GUI application, install dependencies and run: python main.py")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,10 +1,19 @@
 import os
 import platform
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+import bisect
+import functools
+import hashlib
+import heapq
 import json
+import pickle
 
-def get_system_info():
-    """Get basic system information."""
+# On-disk cache of collected scans, reused by the GUI when enabled
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".edfs_cache")
+
+@functools.lru_cache(maxsize=1)
+def _system_info():
+    """Read basic system information once per process."""
     return {
         'platform': platform.system(),
         'platform_version': platform.version(),
@@ -14,6 +23,10 @@ def get_system_info():
         'username': os.getenv('USERNAME') or os.getenv('USER', 'Unknown')
     }
 
+def get_system_info():
+    """Get basic system information (a copy of the per-process cache)."""
+    return dict(_system_info())
+
 def format_timestamp(timestamp):
     """Format timestamp for display."""
     if isinstance(timestamp, datetime):
@@ -25,11 +38,7 @@ def format_timestamp(timestamp):
 
 def truncate_text(text, max_length=50):
     """Truncate text to specified length with ellipsis."""
-    if not text:
-        return ""
-    if len(text) <= max_length:
-        return text
-    return text[:max_length-3] + "..."
+    return text[:max_length-3] + "..." if text and len(text) > max_length else text or ""
 
 def validate_date_range(start_date, end_date):
     """Validate date range."""
@@ -47,27 +56,71 @@ def validate_date_range(start_date, end_date):
 def create_output_directory():
     """Create output directory for reports."""
     output_dir = os.path.join(os.getcwd(), "reports")
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
 def get_unique_filename(base_name, extension=".pdf"):
     """Generate unique filename to avoid overwrites."""
+    # List the directory once instead of checking every candidate name;
+    # normcase keeps the lookup case-insensitive on Windows
+    directory, name = os.path.split(base_name)
+    try:
+        with os.scandir(directory or '.') as entries:
+            existing = {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        existing = set()
+    
     counter = 1
-    filename = f"{base_name}{extension}"
+    filename = f"{name}{extension}"
     
-    while os.path.exists(filename):
-        filename = f"{base_name}_{counter}{extension}"
+    while os.path.normcase(filename) in existing:
+        filename = f"{name}_{counter}{extension}"
         counter += 1
     
-    return filename
+    return os.path.join(directory, filename)
+
+def get_cache_key(*options):
+    """Build a scan cache key from the options that shaped the scan."""
+    return hashlib.sha1(repr(options).encode()).hexdigest()
+
+def save_cached_data(cache_key, data):
+    """Save collected data to the scan cache."""
+    cache_path = os.path.join(CACHE_DIR, f"{cache_key}.pkl")
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return True
+    except Exception as e:
+        print(f"Error saving cached data: {e}")
+        return False
+
+def load_cached_data(cache_key, max_age):
+    """Load collected data from the scan cache if it is at most max_age seconds old."""
+    cache_path = os.path.join(CACHE_DIR, f"{cache_key}.pkl")
+    try:
+        if datetime.now().timestamp() - os.path.getmtime(cache_path) > max_age:
+            return None
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading cached data: {e}")
+        return None
+
+def _metadata_path(report_path):
+    """Return the metadata JSON path that sits next to a report."""
+    return os.path.splitext(report_path)[0] + '_metadata.json'
 
 def save_report_metadata(report_path, metadata):
     """Save report metadata to JSON file."""
-    metadata_path = report_path.replace('.pdf', '_metadata.json')
+    metadata_path = _metadata_path(report_path)
     try:
+        # Serialize first, so the file gets one write instead of one per token
+        text = json.dumps(metadata, indent=2, default=str)
         with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=str)
+            f.write(text)
         return True
     except Exception as e:
         print(f"Error saving metadata: {e}")
@@ -75,7 +128,7 @@ def save_report_metadata(report_path, metadata):
 
 def load_report_metadata(report_path):
     """Load report metadata from JSON file."""
-    metadata_path = report_path.replace('.pdf', '_metadata.json')
+    metadata_path = _metadata_path(report_path)
     try:
         with open(metadata_path, 'r') as f:
             return json.load(f)
@@ -83,26 +136,104 @@ def load_report_metadata(report_path):
         print(f"Error loading metadata: {e}")
         return None
 
-def filter_data_by_date_range(data, start_date, end_date, date_field='timestamp'):
-    """Filter data by date range."""
+def sort_most_recent(items, key, limit=None):
+    """Sort items most recent first, keeping only the first `limit` if given."""
+    if limit is not None and limit < len(items):
+        return heapq.nlargest(limit, items, key=key)
+    items.sort(key=key, reverse=True)
+    return items
+
+class _OldestFirstDates:
+    """Read-only oldest-first view of the dates in a most-recent-first list."""
+    
+    def __init__(self, data, date_field):
+        self._data = data
+        self._date_field = date_field
+        self._last = len(data) - 1
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def __getitem__(self, index):
+        return self._data[self._last - index].get(self._date_field)
+
+def _as_datetime(value, end_of_day=False):
+    """Widen a date to the first or last moment of that day."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time.max if end_of_day else time.min)
+
+def timestamp_bounds(since=None, until=None):
+    """Return a date range as POSIX timestamps, with open ends as -inf/inf."""
+    lower = _as_datetime(since).timestamp() if since else float('-inf')
+    upper = _as_datetime(until, end_of_day=True).timestamp() if until else float('inf')
+    return lower, upper
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(value):
+    """Parse an ISO 8601 timestamp string, remembering recent results."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def filter_data_by_date_range(data, start_date, end_date, date_field='timestamp', presorted=False,
+                              keep_undated=False):
+    """Filter data by date range.
+    
+    Items without a value in date_field are dropped, or kept with
+    keep_undated=True. With presorted=True the data must already be sorted
+    most recent first and every item must carry a datetime in date_field;
+    the range is then located by binary search instead of a scan.
+    """
     if not start_date or not end_date:
         return data
     
+    start_date = _as_datetime(start_date)
+    end_date = _as_datetime(end_date, end_of_day=True)
+    
+    if presorted:
+        dates = _OldestFirstDates(data, date_field)
+        count = len(data)
+        lower = bisect.bisect_left(dates, start_date)
+        upper = bisect.bisect_right(dates, end_date)
+        return data[count - upper:count - lower] if upper > lower else []
+    
     filtered_data = []
     for item in data:
         item_date = item.get(date_field)
         if item_date:
             if isinstance(item_date, str):
                 try:
-                    item_date = datetime.fromisoformat(item_date.replace('Z', '+00:00'))
-                except:
+                    item_date = _parse_iso_timestamp(item_date)
+                except ValueError:
                     continue
             
             if start_date <= item_date <= end_date:
                 filtered_data.append(item)
+        elif keep_undated:
+            filtered_data.append(item)
     
     return filtered_data
 
+# How each collector's records are dated: (date field, sorted most recent
+# first by that field, keep records with no date). Logins and file shares
+# come back sorted by timestamp, so they can be bisected; processes are
+# dated by start time, and installed apps have none and are always kept.
+COLLECTED_DATE_FIELDS = {
+    'logins': ('timestamp', True, False),
+    'file_shares': ('timestamp', True, False),
+    'app_usage': ('start_time', False, True),
+}
+
+def filter_collected_data(data, start_date, end_date):
+    """Filter collected data, keyed by collector, by date range."""
+    filtered_data = {}
+    for key, items in data.items():
+        date_field, presorted, keep_undated = COLLECTED_DATE_FIELDS.get(key, ('timestamp', False, False))
+        filtered_data[key] = filter_data_by_date_range(items, start_date, end_date,
+                                                       date_field=date_field,
+                                                       presorted=presorted,
+                                                       keep_undated=keep_undated)
+    return filtered_data
+
 def get_data_summary(data_list, key_field='type'):
     """Get summary statistics for data."""
     summary = {}